@@ -0,0 +1,85 @@
+"""
+Build Parquet mirrors of the WORKBank CSV files.
+
+The dashboard reads ``<name>.parquet`` next to each ``<name>.csv`` in the
+SALT-NLP/WORKBank dataset repository when it exists (see data_loader.py). This
+offline script produces those files; it is not part of the app's hot path.
+
+The worker desire file is sorted by Domain and written in small row groups with
+column statistics, so ``pq.read_table(..., filters=[("Domain", "in", ...)])``
+only decodes the row groups of the requested domains.
+
+Usage:
+    python build_parquet_mirrors.py --output-dir parquet_mirrors
+    huggingface-cli upload SALT-NLP/WORKBank parquet_mirrors . --repo-type dataset
+"""
+
+import argparse
+import os
+
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from huggingface_hub import hf_hub_download
+
+from data_loader import (
+    HF_REPO_ID,
+    WORKER_DESIRES_PATH,
+    EXPERT_RATINGS_PATH,
+    TASK_METADATA_PATH,
+    logger
+)
+
+# Rows per Parquet row group; small groups keep Domain min/max statistics selective
+ROW_GROUP_SIZE = 256
+
+
+def build_mirror(path: str, output_dir: str, sort_by_domain: bool = False) -> str:
+    """
+    Convert one dataset CSV to Parquet.
+
+    Args:
+        path: CSV path of the file inside the dataset repository
+        output_dir: Directory the mirror is written to, keeping the repository layout
+        sort_by_domain: Sort rows by "Domain" so row groups cover few domains each
+
+    Returns:
+        Path of the written Parquet file
+    """
+    local_path = hf_hub_download(repo_id=HF_REPO_ID, filename=path, repo_type="dataset")
+    table = pacsv.read_csv(local_path)
+
+    if sort_by_domain:
+        table = table.sort_by("Domain")
+
+    output_path = os.path.join(output_dir, path.replace(".csv", ".parquet"))
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    pq.write_table(
+        table,
+        output_path,
+        row_group_size=ROW_GROUP_SIZE,
+        use_dictionary=True,
+        compression="zstd",
+        write_statistics=True
+    )
+
+    logger.info(f"Wrote {table.num_rows} rows to {output_path}")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build Parquet mirrors of the WORKBank CSV files.")
+    parser.add_argument(
+        "--output-dir",
+        default="parquet_mirrors",
+        help="Directory to write the mirrors to (default: parquet_mirrors)"
+    )
+    args = parser.parse_args()
+
+    build_mirror(WORKER_DESIRES_PATH, args.output_dir, sort_by_domain=True)
+    build_mirror(EXPERT_RATINGS_PATH, args.output_dir)
+    build_mirror(TASK_METADATA_PATH, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
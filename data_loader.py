@@ -5,70 +5,275 @@ This module handles loading data from HuggingFace datasets and provides
 fallback mock data that matches the real dataset schema.
 """
 
+import os
+import tempfile
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy implementation is used instead
+    njit = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HF_REPO_ID = "SALT-NLP/WORKBank"
+
+WORKER_DESIRES_PATH = "worker_data/domain_worker_desires.csv"
+EXPERT_RATINGS_PATH = "expert_ratings/expert_rated_technological_capability.csv"
+TASK_METADATA_PATH = "task_data/task_statement_with_metadata.csv"
+
+# Columns consumed by prepare_analysis_data / get_summary_stats, per source file
+NEEDED_COLS: Dict[str, List[str]] = {
+    WORKER_DESIRES_PATH: [
+        "Task ID",
+        "Task",
+        "Occupation (O*NET-SOC Title)",
+        "Automation Desire Rating",
+        "Job Security Rating",
+        "Enjoyment Rating",
+        "Domain"
+    ],
+    EXPERT_RATINGS_PATH: [
+        "Task ID",
+        "Expert Capability Rating",
+        "Confidence"
+    ],
+    TASK_METADATA_PATH: [
+        "Task ID",
+        "O*NET-SOC Code",
+        "Task Category"
+    ]
+}
+
+# Ratings at or above this value count as "high" in the quadrant analysis
+HIGH_RATING_THRESHOLD = 3.5
+
+# Quadrant names indexed by the codes produced by _readiness_and_quadrants
+QUADRANT_LABELS = ("aligned", "overcapable", "wanted", "ready")
+
+# Columns of the combined frame stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("Domain", "Occupation")
 
-def load_workbank_datasets() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+# Worker aggregates only shown in the task details view; kept out of the combined
+# frame and joined on demand together with "Confidence", "O*NET-SOC Code" and
+# "Task Category"
+WORKER_DETAIL_COLUMNS = ["Automation Desire Std", "Job Security Rating", "Enjoyment Rating"]
+
+# Truncated copies of "Task" used by the dashboard ("Task_30", "Task_60", ...),
+# ending in "..." when the task text is longer
+TASK_PREVIEW_LENGTHS = (30, 60, 80, 100)
+TASK_PREVIEW_COLUMNS = tuple(f"Task_{length}" for length in TASK_PREVIEW_LENGTHS)
+
+# Arrow group_by output columns ("<column>_<aggregation>") -> analysis column names
+WORKER_SUMMARY_COLUMNS: Dict[str, str] = {
+    "Task ID": "Task ID",
+    "Automation Desire Rating_mean": "Automation Desire Rating",
+    "Automation Desire Rating_stddev": "Automation Desire Std",
+    "Automation Desire Rating_count": "Worker Count",
+    "Job Security Rating_mean": "Job Security Rating",
+    "Enjoyment Rating_mean": "Enjoyment Rating",
+    "Task_first": "Task",
+    "Occupation (O*NET-SOC Title)_first": "Occupation",
+    "Domain_first": "Domain"
+}
+
+EXPERT_SUMMARY_COLUMNS: Dict[str, str] = {
+    "Task ID": "Task ID",
+    "Expert Capability Rating_mean": "Expert Capability Rating",
+    "Confidence_mean": "Confidence"
+}
+
+
+def load_workbank_datasets(
+    domains: Optional[Sequence[str]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Load WORKBank datasets from HuggingFace with fallback to mock data.
     
+    Args:
+        domains: If given, only worker responses from these domains are loaded
+        
     Returns:
         Tuple of (worker_desire_df, expert_ratings_df, task_metadata_df)
     """
     try:
         # Try to load from HuggingFace
         logger.info("Attempting to load data from HuggingFace...")
-        return _load_from_huggingface()
+        return _load_from_huggingface(domains)
     except Exception as e:
         logger.warning(f"Failed to load from HuggingFace: {e}")
         logger.info("Using fallback mock data with real schema...")
-        return _load_mock_data()
+        worker_df, expert_df, task_df = _load_mock_data()
+        if domains is not None:
+            worker_df = worker_df[worker_df["Domain"].isin(domains)]
+        return worker_df, expert_df, task_df
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def _load_from_huggingface() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Load datasets from HuggingFace."""
+def _load_from_huggingface(
+    domains: Optional[Sequence[str]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Load datasets from HuggingFace via the memory-mapped Arrow cache."""
     try:
-        from datasets import load_dataset
-        
-        # Load worker desire data
-        worker_desire = load_dataset(
-            "SALT-NLP/WORKBank", 
-            data_files="worker_data/domain_worker_desires.csv"
-        )["train"]
-        worker_df = worker_desire.to_pandas()
-        
-        # Load expert ratings data
-        expert_ratings = load_dataset(
-            "SALT-NLP/WORKBank", 
-            data_files="expert_ratings/expert_rated_technological_capability.csv"
-        )["train"]
-        expert_df = expert_ratings.to_pandas()
-        
-        # Load task metadata
-        task_meta_data = load_dataset(
-            "SALT-NLP/WORKBank", 
-            data_files="task_data/task_statement_with_metadata.csv"
-        )["train"]
-        task_df = task_meta_data.to_pandas()
+        if domains is None:
+            worker_df = _read_arrow_file(get_arrow_path(WORKER_DESIRES_PATH))
+        else:
+            # Read the Parquet mirror directly with a Domain predicate so row
+            # groups of other domains are skipped and the full table is never cached
+            worker_df = _arrow_to_pandas(_read_hf_parquet(WORKER_DESIRES_PATH, domains=domains))
+        expert_df = _read_arrow_file(get_arrow_path(EXPERT_RATINGS_PATH))
+        task_df = _read_arrow_file(get_arrow_path(TASK_METADATA_PATH))
         
         logger.info(f"Loaded {len(worker_df)} worker responses, {len(expert_df)} expert ratings, {len(task_df)} tasks")
         
         return worker_df, expert_df, task_df
         
     except ImportError as e:
-        raise Exception(f"datasets library not installed: {e}")
+        raise Exception(f"huggingface_hub/pyarrow not installed: {e}")
     except Exception as e:
         raise Exception(f"Failed to load data from HuggingFace: {e}")
 
 
+@st.cache_resource(ttl=3600)  # Re-download after 1 hour
+def get_arrow_path(path: str) -> str:
+    """
+    Download one WORKBank table once and write it as an Arrow IPC file.
+    
+    The file is shared by every session and worker process, so reruns only
+    memory-map it instead of unpickling a DataFrame copy per session. Each
+    table is cached on its own, so domain-filtered loads never fetch the full
+    worker table.
+    
+    Args:
+        path: CSV path of the file inside the dataset repository
+        
+    Returns:
+        Path of the Arrow IPC file
+    """
+    table = _read_hf_parquet(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    arrow_path = os.path.join(tempfile.gettempdir(), f"workbank_{name}.arrow")
+    
+    # Write next to the target and swap in atomically so sessions that
+    # still map the previous file never see it truncated
+    tmp_path = f"{arrow_path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, arrow_path)
+    
+    return arrow_path
+
+
+def _read_arrow_file(path: str) -> pd.DataFrame:
+    """Memory-map an Arrow IPC file and convert it to pandas without parsing."""
+    return _arrow_to_pandas(pa.ipc.open_file(pa.memory_map(path)).read_all())
+
+
+def _arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to a DataFrame of ArrowDtype columns.
+    
+    The columns wrap the table's buffers directly, so numeric columns are not
+    copied and no NumPy block consolidation takes place. Use
+    ``.to_numpy(dtype=float, na_value=np.nan)`` where a NumPy array is needed.
+    """
+    return table.to_pandas(
+        zero_copy_only=False, split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype
+    )
+
+
+def _read_hf_parquet(path: str, domains: Optional[Sequence[str]] = None) -> pa.Table:
+    """
+    Read one WORKBank file from HuggingFace as an Arrow table.
+    
+    Prefers the Parquet mirror of ``path`` and falls back to the CSV only
+    when no mirror exists. Only the columns listed in NEEDED_COLS are decoded.
+    
+    Args:
+        path: CSV path of the file inside the dataset repository
+        domains: If given, only rows whose "Domain" is in this list are read.
+            The worker mirror is sorted by Domain (see build_parquet_mirrors.py),
+            so the Parquet row-group statistics let non-matching groups be skipped.
+        
+    Returns:
+        pyarrow.Table restricted to NEEDED_COLS[path]
+    """
+    import pyarrow.parquet as pq
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.utils import EntryNotFoundError, LocalEntryNotFoundError
+    
+    columns = NEEDED_COLS[path]
+    
+    try:
+        local_path = hf_hub_download(
+            repo_id=HF_REPO_ID,
+            filename=path.replace(".csv", ".parquet"),
+            repo_type="dataset"
+        )
+    except LocalEntryNotFoundError:
+        # Offline or unreachable Hub: the CSV download would fail the same way
+        raise
+    except EntryNotFoundError:
+        import pyarrow.csv as pacsv
+        
+        logger.info(f"No Parquet mirror for {path}, reading CSV instead")
+        local_path = hf_hub_download(repo_id=HF_REPO_ID, filename=path, repo_type="dataset")
+        table = pacsv.read_csv(
+            local_path,
+            convert_options=pacsv.ConvertOptions(include_columns=columns)
+        )
+        if domains is not None:
+            table = table.filter(pc.is_in(table["Domain"], value_set=pa.array(list(domains))))
+        return table
+    
+    filters = [("Domain", "in", tuple(domains))] if domains is not None else None
+    return pq.read_table(local_path, columns=columns, filters=filters, memory_map=True)
+
+
+# Mock data used when the Hugging Face datasets cannot be loaded: column names
+# plus one tuple per row, matching the real WORKBank dataset schema
+_MOCK_WORKER_COLUMNS = (
+    "Task ID", "Task", "Occupation (O*NET-SOC Title)", "Automation Desire Rating",
+    "Job Security Rating", "Enjoyment Rating", "Worker ID", "Domain"
+)
+_MOCK_WORKER_ROWS = (
+    ("T001", "Create marketing materials and promotional content", "Marketing Managers", 4.2, 3.1, 3.8, "W001", "Marketing"),
+    ("T002", "Analyze customer feedback and survey responses", "Market Research Analysts", 4.7, 2.8, 2.9, "W002", "Research"),
+    ("T003", "Schedule appointments and manage calendars", "Administrative Assistants", 4.9, 2.3, 2.1, "W003", "Administration"),
+    ("T004", "Provide emotional support and counseling to patients", "Clinical Social Workers", 1.2, 4.8, 4.9, "W004", "Healthcare"),
+    ("T005", "Write and edit technical documentation", "Technical Writers", 3.4, 3.6, 4.1, "W005", "Technical"),
+    ("T001", "Create marketing materials and promotional content", "Marketing Managers", 3.8, 3.5, 4.0, "W006", "Marketing"),
+    ("T002", "Analyze customer feedback and survey responses", "Market Research Analysts", 4.5, 3.0, 3.2, "W007", "Research")
+)
+
+_MOCK_EXPERT_COLUMNS = ("Task ID", "Task", "Expert Capability Rating", "Expert ID", "Confidence")
+_MOCK_EXPERT_ROWS = (
+    ("T001", "Create marketing materials and promotional content", 3.5, "E001", 4.2),
+    ("T002", "Analyze customer feedback and survey responses", 4.1, "E002", 4.5),
+    ("T003", "Schedule appointments and manage calendars", 4.8, "E003", 4.9),
+    ("T004", "Provide emotional support and counseling to patients", 1.5, "E004", 4.7),
+    ("T005", "Write and edit technical documentation", 3.8, "E005", 4.0)
+)
+
+_MOCK_TASK_COLUMNS = ("Task ID", "Task", "Occupation (O*NET-SOC Title)", "O*NET-SOC Code", "Domain", "Task Category")
+_MOCK_TASK_ROWS = (
+    ("T001", "Create marketing materials and promotional content", "Marketing Managers", "11-2021.00", "Marketing", "Creative"),
+    ("T002", "Analyze customer feedback and survey responses", "Market Research Analysts", "13-1161.00", "Research", "Analytical"),
+    ("T003", "Schedule appointments and manage calendars", "Administrative Assistants", "43-6011.00", "Administration", "Organizational"),
+    ("T004", "Provide emotional support and counseling to patients", "Clinical Social Workers", "21-1022.00", "Healthcare", "Interpersonal"),
+    ("T005", "Write and edit technical documentation", "Technical Writers", "27-3042.00", "Technical", "Communication")
+)
+
+
 def _load_mock_data() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Load mock data that matches the real WORKBank dataset schema.
@@ -77,172 +282,85 @@ def _load_mock_data() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     
     # Mock worker desire data (based on domain_worker_desires.csv schema)
-    worker_data = [
-        {
-            "Task ID": "T001",
-            "Task": "Create marketing materials and promotional content",
-            "Occupation (O*NET-SOC Title)": "Marketing Managers",
-            "Automation Desire Rating": 4.2,
-            "Job Security Rating": 3.1,
-            "Enjoyment Rating": 3.8,
-            "Worker ID": "W001",
-            "Domain": "Marketing"
-        },
-        {
-            "Task ID": "T002", 
-            "Task": "Analyze customer feedback and survey responses",
-            "Occupation (O*NET-SOC Title)": "Market Research Analysts",
-            "Automation Desire Rating": 4.7,
-            "Job Security Rating": 2.8,
-            "Enjoyment Rating": 2.9,
-            "Worker ID": "W002",
-            "Domain": "Research"
-        },
-        {
-            "Task ID": "T003",
-            "Task": "Schedule appointments and manage calendars",
-            "Occupation (O*NET-SOC Title)": "Administrative Assistants",
-            "Automation Desire Rating": 4.9,
-            "Job Security Rating": 2.3,
-            "Enjoyment Rating": 2.1,
-            "Worker ID": "W003",
-            "Domain": "Administration"
-        },
-        {
-            "Task ID": "T004",
-            "Task": "Provide emotional support and counseling to patients",
-            "Occupation (O*NET-SOC Title)": "Clinical Social Workers",
-            "Automation Desire Rating": 1.2,
-            "Job Security Rating": 4.8,
-            "Enjoyment Rating": 4.9,
-            "Worker ID": "W004",
-            "Domain": "Healthcare"
-        },
-        {
-            "Task ID": "T005",
-            "Task": "Write and edit technical documentation",
-            "Occupation (O*NET-SOC Title)": "Technical Writers",
-            "Automation Desire Rating": 3.4,
-            "Job Security Rating": 3.6,
-            "Enjoyment Rating": 4.1,
-            "Worker ID": "W005",
-            "Domain": "Technical"
-        },
-        {
-            "Task ID": "T001",
-            "Task": "Create marketing materials and promotional content",
-            "Occupation (O*NET-SOC Title)": "Marketing Managers", 
-            "Automation Desire Rating": 3.8,
-            "Job Security Rating": 3.5,
-            "Enjoyment Rating": 4.0,
-            "Worker ID": "W006",
-            "Domain": "Marketing"
-        },
-        {
-            "Task ID": "T002",
-            "Task": "Analyze customer feedback and survey responses", 
-            "Occupation (O*NET-SOC Title)": "Market Research Analysts",
-            "Automation Desire Rating": 4.5,
-            "Job Security Rating": 3.0,
-            "Enjoyment Rating": 3.2,
-            "Worker ID": "W007",
-            "Domain": "Research"
-        }
-    ]
+    worker_df = pd.DataFrame.from_records(_MOCK_WORKER_ROWS, columns=_MOCK_WORKER_COLUMNS)
     
     # Mock expert ratings data
-    expert_data = [
-        {
-            "Task ID": "T001",
-            "Task": "Create marketing materials and promotional content",
-            "Expert Capability Rating": 3.5,
-            "Expert ID": "E001",
-            "Confidence": 4.2
-        },
-        {
-            "Task ID": "T002",
-            "Task": "Analyze customer feedback and survey responses",
-            "Expert Capability Rating": 4.1,
-            "Expert ID": "E002", 
-            "Confidence": 4.5
-        },
-        {
-            "Task ID": "T003",
-            "Task": "Schedule appointments and manage calendars",
-            "Expert Capability Rating": 4.8,
-            "Expert ID": "E003",
-            "Confidence": 4.9
-        },
-        {
-            "Task ID": "T004",
-            "Task": "Provide emotional support and counseling to patients",
-            "Expert Capability Rating": 1.5,
-            "Expert ID": "E004",
-            "Confidence": 4.7
-        },
-        {
-            "Task ID": "T005",
-            "Task": "Write and edit technical documentation",
-            "Expert Capability Rating": 3.8,
-            "Expert ID": "E005",
-            "Confidence": 4.0
-        }
-    ]
+    expert_df = pd.DataFrame.from_records(_MOCK_EXPERT_ROWS, columns=_MOCK_EXPERT_COLUMNS)
     
     # Mock task metadata
-    task_metadata = [
-        {
-            "Task ID": "T001",
-            "Task": "Create marketing materials and promotional content",
-            "Occupation (O*NET-SOC Title)": "Marketing Managers",
-            "O*NET-SOC Code": "11-2021.00",
-            "Domain": "Marketing",
-            "Task Category": "Creative"
-        },
-        {
-            "Task ID": "T002", 
-            "Task": "Analyze customer feedback and survey responses",
-            "Occupation (O*NET-SOC Title)": "Market Research Analysts",
-            "O*NET-SOC Code": "13-1161.00",
-            "Domain": "Research",
-            "Task Category": "Analytical"
-        },
-        {
-            "Task ID": "T003",
-            "Task": "Schedule appointments and manage calendars",
-            "Occupation (O*NET-SOC Title)": "Administrative Assistants",
-            "O*NET-SOC Code": "43-6011.00", 
-            "Domain": "Administration",
-            "Task Category": "Organizational"
-        },
-        {
-            "Task ID": "T004",
-            "Task": "Provide emotional support and counseling to patients",
-            "Occupation (O*NET-SOC Title)": "Clinical Social Workers",
-            "O*NET-SOC Code": "21-1022.00",
-            "Domain": "Healthcare", 
-            "Task Category": "Interpersonal"
-        },
-        {
-            "Task ID": "T005",
-            "Task": "Write and edit technical documentation",
-            "Occupation (O*NET-SOC Title)": "Technical Writers",
-            "O*NET-SOC Code": "27-3042.00",
-            "Domain": "Technical",
-            "Task Category": "Communication"
-        }
-    ]
-    
-    worker_df = pd.DataFrame(worker_data)
-    expert_df = pd.DataFrame(expert_data)
-    task_df = pd.DataFrame(task_metadata)
+    task_df = pd.DataFrame.from_records(_MOCK_TASK_ROWS, columns=_MOCK_TASK_COLUMNS)
     
     logger.info(f"Loaded mock data: {len(worker_df)} worker responses, {len(expert_df)} expert ratings, {len(task_df)} tasks")
     
     return worker_df, expert_df, task_df
 
 
-def prepare_analysis_data(worker_df: pd.DataFrame, expert_df: pd.DataFrame, task_df: pd.DataFrame) -> pd.DataFrame:
+def _readiness_and_quadrants_numpy(desire: np.ndarray, capability: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy implementation of _readiness_and_quadrants."""
+    high_desire = desire >= HIGH_RATING_THRESHOLD
+    high_capability = capability >= HIGH_RATING_THRESHOLD
+    low_capability = capability < HIGH_RATING_THRESHOLD
+    quadrant_codes = np.select(
+        [high_desire & high_capability, high_desire & low_capability, ~high_desire & high_capability],
+        [3, 2, 1],
+        default=0
+    ).astype(np.int8)
+    return np.minimum(desire, capability), quadrant_codes
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _readiness_and_quadrants_numba(desire, capability):
+        """Fused Numba kernel with the same NaN semantics as the NumPy implementation."""
+        n = desire.shape[0]
+        readiness = np.empty(n)
+        quadrant_codes = np.empty(n, np.int8)
+        for i in range(n):
+            d = desire[i]
+            c = capability[i]
+            readiness[i] = np.nan if (d != d or c != c) else min(d, c)
+            if d >= HIGH_RATING_THRESHOLD:
+                if c >= HIGH_RATING_THRESHOLD:
+                    quadrant_codes[i] = 3
+                elif c < HIGH_RATING_THRESHOLD:
+                    quadrant_codes[i] = 2
+                else:
+                    quadrant_codes[i] = 0
+            elif c >= HIGH_RATING_THRESHOLD:
+                quadrant_codes[i] = 1
+            else:
+                quadrant_codes[i] = 0
+        return readiness, quadrant_codes
+    
+    try:
+        # Compile (or load the cached build) at import so the first rerun pays no JIT cost
+        _readiness_and_quadrants_numba(np.zeros(1), np.zeros(1))
+    except Exception as e:
+        logger.warning(f"Numba kernel unavailable, using NumPy: {e}")
+        _readiness_and_quadrants_numba = None
+else:
+    _readiness_and_quadrants_numba = None
+
+
+def _readiness_and_quadrants(desire: np.ndarray, capability: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute automation readiness and quadrant codes for each task.
+    
+    Readiness is min(desire, capability). Quadrant codes index QUADRANT_LABELS:
+    "ready" is high desire and high capability, "wanted" is high desire and low
+    capability, "overcapable" is low desire and high capability, anything
+    else (including missing capability with high desire) is "aligned".
+    
+    Uses the fused Numba kernel when numba is installed, NumPy otherwise.
+    """
+    if _readiness_and_quadrants_numba is not None:
+        return _readiness_and_quadrants_numba(desire, capability)
+    return _readiness_and_quadrants_numpy(desire, capability)
+
+
+def prepare_analysis_data(
+    worker_df: pd.DataFrame, expert_df: pd.DataFrame, task_df: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
     """
     Prepare combined dataset for analysis by joining the three datasets.
     
@@ -252,64 +370,101 @@ def prepare_analysis_data(worker_df: pd.DataFrame, expert_df: pd.DataFrame, task
         task_df: Task metadata
         
     Returns:
-        Combined DataFrame ready for analysis
+        Tuple of (combined DataFrame ready for analysis, per-task detail columns
+        keyed by "Task ID", summary statistics)
     """
     
-    # Aggregate worker responses by task
-    worker_summary = worker_df.groupby("Task ID").agg({
-        "Automation Desire Rating": ["mean", "std", "count"],
-        "Job Security Rating": "mean",
-        "Enjoyment Rating": "mean",
-        "Task": "first",
-        "Occupation (O*NET-SOC Title)": "first",
-        "Domain": "first"
-    }).reset_index()
-    
-    # Flatten column names
-    worker_summary.columns = [
-        "Task ID", 
-        "Automation Desire Rating",
-        "Automation Desire Std",
-        "Worker Count",
-        "Job Security Rating", 
-        "Enjoyment Rating",
-        "Task",
-        "Occupation",
-        "Domain"
+    # Aggregate worker responses by task in a single Arrow hash-aggregate pass
+    # ("first" is order-dependent, so the aggregation must run single-threaded)
+    worker_summary = _arrow_to_pandas(
+        pa.Table.from_pandas(worker_df, preserve_index=False)
+        .group_by("Task ID", use_threads=False)
+        .aggregate([
+            ("Automation Desire Rating", "mean"),
+            ("Automation Desire Rating", "stddev", pc.VarianceOptions(ddof=1)),
+            ("Automation Desire Rating", "count"),
+            ("Job Security Rating", "mean"),
+            ("Enjoyment Rating", "mean"),
+            ("Task", "first"),
+            ("Occupation (O*NET-SOC Title)", "first"),
+            ("Domain", "first")
+        ])
+        .sort_by("Task ID")
+    )
+    worker_summary = worker_summary.rename(columns=WORKER_SUMMARY_COLUMNS)[
+        list(WORKER_SUMMARY_COLUMNS.values())
     ]
     
     # Aggregate expert ratings by task (in case multiple experts rate same task)
-    expert_summary = expert_df.groupby("Task ID").agg({
-        "Expert Capability Rating": "mean",
-        "Confidence": "mean"
-    }).reset_index()
+    expert_summary = _arrow_to_pandas(
+        pa.Table.from_pandas(expert_df, preserve_index=False)
+        .group_by("Task ID")
+        .aggregate([
+            ("Expert Capability Rating", "mean"),
+            ("Confidence", "mean")
+        ])
+    )
+    expert_summary = expert_summary.rename(columns=EXPERT_SUMMARY_COLUMNS)[
+        list(EXPERT_SUMMARY_COLUMNS.values())
+    ]
     
-    # Join datasets
-    combined_df = worker_summary.merge(expert_summary, on="Task ID", how="left")
-    combined_df = combined_df.merge(task_df[["Task ID", "O*NET-SOC Code", "Task Category"]], on="Task ID", how="left")
+    # Join datasets: the lean combined frame gets only the columns used across
+    # the dashboard, the detail-only columns are joined into a separate frame
+    combined_df = worker_summary.drop(columns=WORKER_DETAIL_COLUMNS).merge(
+        expert_summary[["Task ID", "Expert Capability Rating"]], on="Task ID", how="left"
+    )
+    details_df = (
+        worker_summary[["Task ID", *WORKER_DETAIL_COLUMNS]]
+        .merge(expert_summary[["Task ID", "Confidence"]], on="Task ID", how="left")
+        .merge(task_df[["Task ID", "O*NET-SOC Code", "Task Category"]], on="Task ID", how="left")
+    )
+    details_df["Task Category"] = details_df["Task Category"].astype("category")
+    
+    desire = combined_df["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan)
+    capability = combined_df["Expert Capability Rating"].to_numpy(dtype=float, na_value=np.nan)
     
     # Calculate automation readiness (alignment between desire and capability)
-    combined_df["Automation Readiness"] = combined_df.apply(
-        lambda row: min(row["Automation Desire Rating"], row["Expert Capability Rating"]), 
-        axis=1
-    )
+    # and classify tasks into desire/capability quadrants in one pass
+    readiness, quadrant_codes = _readiness_and_quadrants(desire, capability)
+    combined_df["Automation Readiness"] = readiness
+    combined_df["Quadrant"] = pd.Categorical.from_codes(quadrant_codes, categories=QUADRANT_LABELS)
     
-    # Calculate desire-capability gap
-    combined_df["Desire Capability Gap"] = (
-        combined_df["Automation Desire Rating"] - combined_df["Expert Capability Rating"]
-    )
+    # Task text is Arrow-backed; truncated display labels (with "..." appended
+    # when text was cut) are built once here instead of per row in the render loops
+    combined_df["Task"] = combined_df["Task"].astype("string[pyarrow]")
+    task_lengths = combined_df["Task"].str.len()
+    for length, col in zip(TASK_PREVIEW_LENGTHS, TASK_PREVIEW_COLUMNS):
+        preview = combined_df["Task"].str.slice(0, length)
+        combined_df[col] = preview.where(task_lengths <= length, preview + "...")
+    
+    # Low-cardinality labels: store as categoricals so filtering works on integer codes
+    for col in CATEGORICAL_COLUMNS:
+        combined_df[col] = combined_df[col].astype("category")
     
-    return combined_df
+    return combined_df, details_df, get_summary_stats(combined_df)
 
 
 def get_summary_stats(combined_df: pd.DataFrame) -> Dict:
-    """Get summary statistics for the dashboard."""
+    """
+    Get summary statistics for the dashboard.
+    
+    Expects the combined frame from prepare_analysis_data: every reduction runs
+    on a contiguous NumPy array, and distinct values of the categorical columns
+    are counted from their integer codes.
+    """
+    def column_values(col: str) -> np.ndarray:
+        return combined_df[col].to_numpy(dtype=float, na_value=np.nan)
+    
+    def unique_count(col: str) -> int:
+        codes = combined_df[col].cat.codes.to_numpy()
+        return int(np.count_nonzero(np.bincount(codes[codes >= 0])))
+    
     return {
         "total_tasks": len(combined_df),
-        "total_workers": combined_df["Worker Count"].sum(),
-        "avg_automation_desire": combined_df["Automation Desire Rating"].mean(),
-        "avg_expert_capability": combined_df["Expert Capability Rating"].mean(),
-        "avg_automation_readiness": combined_df["Automation Readiness"].mean(),
-        "unique_occupations": combined_df["Occupation"].nunique(),
-        "unique_domains": combined_df["Domain"].nunique()
+        "total_workers": int(combined_df["Worker Count"].to_numpy(dtype=np.int64, na_value=0).sum()),
+        "avg_automation_desire": float(np.nanmean(column_values("Automation Desire Rating"))),
+        "avg_expert_capability": float(np.nanmean(column_values("Expert Capability Rating"))),
+        "avg_automation_readiness": float(np.nanmean(column_values("Automation Readiness"))),
+        "unique_occupations": unique_count("Occupation"),
+        "unique_domains": unique_count("Domain")
     }
\ No newline at end of file
@@ -6,35 +6,192 @@ which captures preferences from 1,500 U.S. domain workers and capability assessm
 from AI experts across 844 tasks and 104 occupations.
 
 Installation Instructions:
-1. Install dependencies: pip install streamlit pandas matplotlib datasets
+1. Install dependencies: pip install -r requirements.txt
 2. Run the app: streamlit run streamlit_app.py  
 3. The app will open in your browser at http://localhost:8501
 
 The app loads data from the WORKBank datasets hosted on Hugging Face.
 """
 
+import functools
+import io
+import re
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-from data_loader import load_workbank_datasets, prepare_analysis_data, get_summary_stats
+from data_loader import load_workbank_datasets, prepare_analysis_data, TASK_PREVIEW_COLUMNS
+
+# Resolution of the cached PNG charts (the scatter; the histogram is SVG)
+FIGURE_DPI = 110
+
+# Renders the "Value" column of the task details ratings table as 0-5 progress bars
+RATINGS_COLUMN_CONFIG = {
+    "Value": st.column_config.ProgressColumn(min_value=0, max_value=5, format="%.1f")
+}
+
+# Task details insight messages and their alert elements, indexed by insight + 1
+# (-1: capability exceeds desire, 0: aligned, 1: desire exceeds capability)
+STATUS_MSGS = (
+    "⚠️ AI capability significantly exceeds worker desire for automation",
+    "✅ Worker desire reasonably aligns with AI capability",
+    "📈 Workers want significantly more automation than current AI capability allows"
+)
+STATUS_FN = (st.warning, st.success, st.info)
 
-@st.cache_data
+@st.cache_resource(ttl=24 * 60 * 60, show_spinner=False)
 def load_data():
-    """Load and prepare WORKBank data."""
+    """
+    Load and prepare WORKBank data.
+    
+    Cached as a resource so the prepared frames are built once per process and
+    shared by all sessions instead of being unpickled on every rerun. Callers
+    must treat the returned frames as read-only.
+    """
     worker_df, expert_df, task_df = load_workbank_datasets()
-    combined_df = prepare_analysis_data(worker_df, expert_df, task_df)
-    return combined_df, worker_df, expert_df, task_df
+    combined_df, details_df, stats = prepare_analysis_data(worker_df, expert_df, task_df)
+    return combined_df, details_df, stats, legacy_chart_data(combined_df), worker_df, expert_df, task_df
+
+
+def get_details_df(rows: pd.DataFrame, details_df: pd.DataFrame) -> pd.DataFrame:
+    """Return the given combined rows, in order and with a fresh index, joined with their detail columns."""
+    return rows.join(details_df.set_index("Task ID"), on="Task ID").reset_index(drop=True)
+
+
+def legacy_chart_data(combined_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ratings of the first ten tasks for the legacy comparison chart.
+    
+    Indexed by "<Task ID>: <shortened task>" so tasks sharing their first 30
+    characters still get a bar each. Built by load_data(), so it is cached
+    and refreshed together with the combined frame.
+    """
+    chart_data = combined_df.head(10)
+    return pd.DataFrame(
+        {
+            'Worker Automation Desire': chart_data['Automation Desire Rating'].to_numpy(dtype=float, na_value=np.nan),
+            'Expert AI Capability Rating': chart_data['Expert Capability Rating'].to_numpy(dtype=float, na_value=np.nan)
+        },
+        index=pd.Index(chart_data['Task ID'].astype(str) + ': ' + chart_data['Task_30'].astype(str), name='Tasks')
+    )
+
+
+def iter_rows(df: pd.DataFrame, index: bool = False):
+    """
+    Iterate over DataFrame rows as namedtuples.
+    
+    Non-identifier characters in column names are replaced with underscores,
+    so "Automation Desire Rating" is read as ``row.Automation_Desire_Rating``.
+    With ``index=True`` the row label is available as ``row.Index``.
+    """
+    return df.rename(columns=lambda col: re.sub(r"\W", "_", col)).itertuples(index=index)
+
+
+@functools.cache
+def _pyplot():
+    """
+    Import pyplot on first use, with the non-interactive Agg backend.
+    
+    Streamlit re-executes this script on every interaction, so keeping the
+    import out of module scope means tabs without charts never pay for it.
+    The result is memoized: backend selection and import run once per process.
+    SVG output keeps text as <text> elements instead of glyph paths.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    matplotlib.rcParams["svg.fonttype"] = "none"
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _figure_to_png(fig) -> bytes:
+    """Render a matplotlib figure to PNG bytes and release it."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=FIGURE_DPI, bbox_inches="tight")
+    _pyplot().close(fig)
+    return buf.getvalue()
+
+
+def _figure_to_svg(fig) -> str:
+    """Render a matplotlib figure to an SVG document and release it."""
+    buf = io.StringIO()
+    fig.savefig(buf, format="svg", bbox_inches="tight")
+    _pyplot().close(fig)
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _desire_histogram_svg(desire: np.ndarray) -> str:
+    """Render the automation desire histogram as an SVG document."""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
+    ax.hist(desire, bins=20, alpha=0.7, color='steelblue', edgecolor='black')
+    ax.set_xlabel("Automation Desire Rating")
+    ax.set_ylabel("Number of Tasks")
+    ax.set_title("Distribution of Automation Desire Ratings")
+    ax.grid(True, alpha=0.3)
+    
+    return _figure_to_svg(fig)
 
 
-def render_overview_tab(combined_df: pd.DataFrame):
+@st.cache_data(ttl=3600, show_spinner=False)
+def _viability_scatter_png(domains: tuple, capability: np.ndarray, desire: np.ndarray) -> bytes:
+    """Render the desire vs capability scatter, colored by domain, as PNG bytes."""
+    plt = _pyplot()
+    from matplotlib.lines import Line2D
+    
+    fig, ax = plt.subplots(figsize=(12, 8), layout="constrained")
+    
+    # Color by domain: one scatter call with a color per point
+    codes, unique_domains = pd.factorize(np.asarray(domains))
+    colors = plt.cm.Set3(np.linspace(0, 1, len(unique_domains)))
+    
+    ax.scatter(capability, desire, c=colors[codes], alpha=0.7, s=100)
+    
+    # Add diagonal line for alignment
+    alignment_line, = ax.plot([1, 5], [1, 5], 'k--', alpha=0.5, linewidth=2, label='Perfect Alignment')
+    
+    legend_handles = [
+        Line2D([], [], marker='o', linestyle='', markersize=10, color=colors[i], alpha=0.7, label=domain)
+        for i, domain in enumerate(unique_domains)
+    ]
+    legend_handles.append(alignment_line)
+    
+    ax.set_xlabel("Expert AI Capability Rating")
+    ax.set_ylabel("Worker Automation Desire Rating") 
+    ax.set_title("Automation Desire vs AI Capability by Domain")
+    ax.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(0.5, 5.5)
+    ax.set_ylim(0.5, 5.5)
+    
+    return _figure_to_png(fig)
+
+
+def category_mask(column: pd.Series, selected) -> np.ndarray:
+    """Boolean mask of rows of a categorical column whose value is in ``selected``, computed on the codes."""
+    selected_codes = column.cat.categories.get_indexer(list(selected))
+    # -1 marks values not among the categories; it is also the code for missing values
+    return np.isin(column.cat.codes.to_numpy(), selected_codes[selected_codes >= 0])
+
+
+def render_task_table(tasks: pd.DataFrame):
+    """Render occupation, truncated task and automation desire as a single table."""
+    st.dataframe(
+        tasks[["Occupation", "Task_100", "Automation Desire Rating"]].rename(columns={"Task_100": "Task"}),
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "Automation Desire Rating": st.column_config.NumberColumn(format="%.1f")
+        }
+    )
+
+
+def render_overview_tab(stats: dict):
     """Render the overview tab with key metrics and high-level analysis."""
     
     st.header("WORKBank Overview")
     
-    # Get summary statistics
-    stats = get_summary_stats(combined_df)
-    
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -103,8 +260,8 @@ def render_automation_desire_tab(combined_df: pd.DataFrame):
     with col1:
         selected_domains = st.multiselect(
             "Filter by Domain",
-            options=combined_df["Domain"].unique(),
-            default=combined_df["Domain"].unique()
+            options=combined_df["Domain"].cat.categories,
+            default=combined_df["Domain"].cat.categories
         )
     
     with col2:
@@ -116,48 +273,35 @@ def render_automation_desire_tab(combined_df: pd.DataFrame):
             step=0.1
         )
     
-    # Filter data
-    filtered_df = combined_df[
-        (combined_df["Domain"].isin(selected_domains)) &
-        (combined_df["Automation Desire Rating"] >= automation_range[0]) &
-        (combined_df["Automation Desire Rating"] <= automation_range[1])
-    ]
-    
-    # Sort by automation desire
-    filtered_df = filtered_df.sort_values("Automation Desire Rating", ascending=False)
+    # Filter data with a single NumPy mask
+    desire = combined_df["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan)
+    mask = (
+        category_mask(combined_df["Domain"], selected_domains) &
+        (desire >= automation_range[0]) &
+        (desire <= automation_range[1])
+    )
+    filtered_df = combined_df.iloc[mask]
     
     # Top and bottom tasks
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Highest Automation Desire")
-        top_tasks = filtered_df.head(5)
-        for _, task in top_tasks.iterrows():
-            st.write(f"**{task['Occupation']}**")
-            st.write(f"*{task['Task'][:100]}...*")
-            st.write(f"Automation Desire: {task['Automation Desire Rating']:.1f}/5.0")
-            st.write("---")
+        top_tasks = filtered_df.nlargest(5, "Automation Desire Rating")
+        render_task_table(top_tasks)
     
     with col2:
         st.subheader("Lowest Automation Desire")
-        bottom_tasks = filtered_df.tail(5)
-        for _, task in bottom_tasks.iterrows():
-            st.write(f"**{task['Occupation']}**")
-            st.write(f"*{task['Task'][:100]}...*")
-            st.write(f"Automation Desire: {task['Automation Desire Rating']:.1f}/5.0")
-            st.write("---")
+        bottom_tasks = filtered_df.nsmallest(5, "Automation Desire Rating")
+        render_task_table(bottom_tasks)
     
     # Distribution plot
     st.subheader("Automation Desire Distribution")
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.hist(filtered_df["Automation Desire Rating"], bins=20, alpha=0.7, color='steelblue', edgecolor='black')
-    ax.set_xlabel("Automation Desire Rating")
-    ax.set_ylabel("Number of Tasks")
-    ax.set_title("Distribution of Automation Desire Ratings")
-    ax.grid(True, alpha=0.3)
-    
-    st.pyplot(fig)
+    st.image(
+        _desire_histogram_svg(filtered_df["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan)),
+        width="stretch"
+    )
 
 
 def render_automation_viability_tab(combined_df: pd.DataFrame):
@@ -168,80 +312,53 @@ def render_automation_viability_tab(combined_df: pd.DataFrame):
     # Scatter plot of desire vs capability
     st.subheader("Worker Desire vs AI Capability")
     
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
-    # Color by domain
-    domains = combined_df["Domain"].unique()
-    colors = plt.cm.Set3(np.linspace(0, 1, len(domains)))
-    
-    for i, domain in enumerate(domains):
-        domain_data = combined_df[combined_df["Domain"] == domain]
-        ax.scatter(
-            domain_data["Expert Capability Rating"],
-            domain_data["Automation Desire Rating"], 
-            c=[colors[i]], 
-            label=domain,
-            alpha=0.7,
-            s=100
-        )
-    
-    # Add diagonal line for alignment
-    ax.plot([1, 5], [1, 5], 'k--', alpha=0.5, linewidth=2, label='Perfect Alignment')
-    
-    ax.set_xlabel("Expert AI Capability Rating")
-    ax.set_ylabel("Worker Automation Desire Rating") 
-    ax.set_title("Automation Desire vs AI Capability by Domain")
-    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-    ax.grid(True, alpha=0.3)
-    ax.set_xlim(0.5, 5.5)
-    ax.set_ylim(0.5, 5.5)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    st.image(
+        _viability_scatter_png(
+            tuple(combined_df["Domain"]),
+            combined_df["Expert Capability Rating"].to_numpy(dtype=float, na_value=np.nan),
+            combined_df["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan)
+        ),
+        width="stretch"
+    )
     
     # Quadrant analysis
     st.subheader("Quadrant Analysis")
     
     col1, col2 = st.columns(2)
     
-    # High desire, high capability (automation ready)
-    automation_ready = combined_df[
-        (combined_df["Automation Desire Rating"] >= 3.5) & 
-        (combined_df["Expert Capability Rating"] >= 3.5)
-    ]
-    
-    # High desire, low capability (automation wanted but not feasible)
-    automation_wanted = combined_df[
-        (combined_df["Automation Desire Rating"] >= 3.5) & 
-        (combined_df["Expert Capability Rating"] < 3.5)
-    ]
+    # Quadrants are precomputed in prepare_analysis_data: "ready" is high desire and
+    # high capability, "wanted" is high desire but low capability
+    quadrants = combined_df.groupby("Quadrant", sort=False, observed=True)
+    quadrant_counts = quadrants.size().to_dict()
+    ready_count = quadrant_counts.get("ready", 0)
+    wanted_count = quadrant_counts.get("wanted", 0)
     
     with col1:
         st.metric(
             label="Automation Ready Tasks",
-            value=len(automation_ready),
+            value=ready_count,
             help="High worker desire and high AI capability"
         )
         
-        if len(automation_ready) > 0:
+        if ready_count > 0:
             st.write("**Top Automation Ready Tasks:**")
-            for _, task in automation_ready.head(3).iterrows():
-                st.write(f"• {task['Occupation']}: {task['Task'][:80]}...")
+            for task in iter_rows(quadrants.get_group("ready").head(3)):
+                st.write(f"• {task.Occupation}: {task.Task_80}")
     
     with col2:
         st.metric(
             label="Automation Wanted Tasks", 
-            value=len(automation_wanted),
+            value=wanted_count,
             help="High worker desire but low AI capability"
         )
         
-        if len(automation_wanted) > 0:
+        if wanted_count > 0:
             st.write("**Top Automation Wanted Tasks:**")
-            for _, task in automation_wanted.head(3).iterrows():
-                st.write(f"• {task['Occupation']}: {task['Task'][:80]}...")
+            for task in iter_rows(quadrants.get_group("wanted").head(3)):
+                st.write(f"• {task.Occupation}: {task.Task_80}")
 
 
-def render_task_details_tab(combined_df: pd.DataFrame):
+def render_task_details_tab(combined_df: pd.DataFrame, details_df: pd.DataFrame):
     """Render detailed task analysis tab."""
     
     st.header("Detailed Task Analysis")
@@ -277,73 +394,97 @@ def render_task_details_tab(combined_df: pd.DataFrame):
     
     # Sort data
     ascending = sort_order == "Ascending"
-    sorted_df = combined_df.sort_values(sort_by, ascending=ascending)
+    if sort_by == "Desire Capability Gap":
+        # The gap is not stored in combined_df; compute it only for this sort
+        gap = (
+            combined_df["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan) -
+            combined_df["Expert Capability Rating"].to_numpy(dtype=float, na_value=np.nan)
+        )
+        # Negate rather than reverse for descending order, so missing gaps stay last
+        sorted_df = combined_df.iloc[np.argsort(gap if ascending else -gap, kind="stable")]
+    else:
+        sorted_df = combined_df.sort_values(sort_by, ascending=ascending)
     
     # Display tasks
-    for i, (_, task) in enumerate(sorted_df.head(show_count).iterrows(), 1):
-        with st.expander(f"Task {i}: {task['Task'][:60]}{'...' if len(task['Task']) > 60 else ''}"):
-            
-            # Task details
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"**Occupation:** {task['Occupation']}")
-                st.markdown(f"**Domain:** {task['Domain']}")
-                st.markdown(f"**Task Category:** {task.get('Task Category', 'N/A')}")
-                st.markdown(f"**Workers Surveyed:** {int(task['Worker Count'])}")
-            
-            with col2:
-                st.markdown(f"**O*NET-SOC Code:** {task.get('O*NET-SOC Code', 'N/A')}")
-                st.markdown(f"**Automation Readiness:** {task['Automation Readiness']:.1f}/5.0")
-                st.markdown(f"**Desire-Capability Gap:** {task['Desire Capability Gap']:+.1f}")
-            
-            st.markdown(f"**Full Task:** {task['Task']}")
-            
-            # Ratings visualization
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**Worker Ratings:**")
-                st.progress(
-                    task['Automation Desire Rating'] / 5.0, 
-                    text=f"Automation Desire: {task['Automation Desire Rating']:.1f}/5.0"
-                )
-                st.progress(
-                    task['Job Security Rating'] / 5.0, 
-                    text=f"Job Security: {task['Job Security Rating']:.1f}/5.0"
-                )
-                st.progress(
-                    task['Enjoyment Rating'] / 5.0, 
-                    text=f"Task Enjoyment: {task['Enjoyment Rating']:.1f}/5.0"
-                )
-            
-            with col2:
-                st.markdown("**Expert Assessment:**")
-                st.progress(
-                    task['Expert Capability Rating'] / 5.0, 
-                    text=f"AI Capability: {task['Expert Capability Rating']:.1f}/5.0"
-                )
-                st.progress(
-                    task['Automation Readiness'] / 5.0, 
-                    text=f"Automation Readiness: {task['Automation Readiness']:.1f}/5.0"
-                )
-                
-                if 'Confidence' in task and not pd.isna(task['Confidence']):
-                    st.progress(
-                        task['Confidence'] / 5.0,
-                        text=f"Expert Confidence: {task['Confidence']:.1f}/5.0"
-                    )
-            
-            # Analysis insight
-            if task['Automation Desire Rating'] > task['Expert Capability Rating'] + 0.5:
-                st.info("📈 Workers want significantly more automation than current AI capability allows")
-            elif task['Expert Capability Rating'] > task['Automation Desire Rating'] + 0.5:
-                st.warning("⚠️ AI capability significantly exceeds worker desire for automation")
-            else:
-                st.success("✅ Worker desire reasonably aligns with AI capability")
-
-
-def render_data_export_tab(combined_df: pd.DataFrame):
+    details = get_details_df(sorted_df.head(show_count), details_df)
+    
+    # Gap and alignment insight for all shown tasks at once: 1 when workers want
+    # significantly more automation, -1 when AI capability significantly exceeds
+    # desire, 0 when they reasonably align
+    gaps = (
+        details["Automation Desire Rating"].to_numpy(dtype=float, na_value=np.nan) -
+        details["Expert Capability Rating"].to_numpy(dtype=float, na_value=np.nan)
+    )
+    insights = np.select([gaps > 0.5, gaps < -0.5], [1, -1], default=0).astype(np.int8)
+    
+    # details has a fresh RangeIndex, so row.Index is the task's position in the list
+    for task, gap, insight in zip(iter_rows(details, index=True), gaps, insights):
+        render_task_row(task, gap, insight)
+
+
+@st.fragment
+def render_task_row(task, gap: float, insight: int):
+    """
+    Render one task of the details list.
+    
+    Runs as a fragment, so opening or closing a task only reruns this row
+    instead of the whole script.
+    """
+    # Collapsed rows only cost a checkbox; the body is built once the user opens it
+    if not st.checkbox(f"Task {task.Index + 1}: {task.Task_60}", key=f"task_details_{task.Task_ID}"):
+        return
+    
+    # Read each field off the row once
+    desire, capability, readiness = task.Automation_Desire_Rating, task.Expert_Capability_Rating, task.Automation_Readiness
+    category, onet_code, confidence = (
+        getattr(task, 'Task_Category', 'N/A'), getattr(task, 'O_NET_SOC_Code', 'N/A'), getattr(task, 'Confidence', np.nan)
+    )
+    
+    with st.container(border=True):
+        
+        # Task details (one markdown element per column)
+        col1, col2 = st.columns(2, gap="small")
+        
+        with col1:
+            st.markdown(
+                f"**Occupation:** {task.Occupation}\n\n"
+                f"**Domain:** {task.Domain}\n\n"
+                f"**Task Category:** {category}\n\n"
+                f"**Workers Surveyed:** {int(task.Worker_Count)}"
+            )
+        
+        with col2:
+            st.markdown(
+                f"**O*NET-SOC Code:** {onet_code}\n\n"
+                f"**Automation Readiness:** {readiness:.1f}/5.0\n\n"
+                f"**Desire-Capability Gap:** {gap:+.1f}"
+            )
+        
+        st.markdown(f"**Full Task:** {task.Task}")
+        
+        # Ratings visualization: one table instead of a progress bar per rating
+        ratings = [
+            ("Worker", "Automation Desire", desire),
+            ("Worker", "Job Security", task.Job_Security_Rating),
+            ("Worker", "Task Enjoyment", task.Enjoyment_Rating),
+            ("Expert", "AI Capability", capability),
+            ("Expert", "Automation Readiness", readiness)
+        ]
+        if not pd.isna(confidence):
+            ratings.append(("Expert", "Expert Confidence", confidence))
+        
+        st.dataframe(
+            pd.DataFrame(ratings, columns=["Source", "Rating", "Value"]),
+            column_config=RATINGS_COLUMN_CONFIG,
+            hide_index=True,
+            width="stretch"
+        )
+        
+        # Analysis insight
+        STATUS_FN[insight + 1](STATUS_MSGS[insight + 1])
+
+
+def render_data_export_tab(combined_df: pd.DataFrame, details_df: pd.DataFrame):
     """Render data export and download tab."""
     
     st.header("Data Export")
@@ -356,22 +497,25 @@ def render_data_export_tab(combined_df: pd.DataFrame):
     with col1:
         selected_domains = st.multiselect(
             "Select Domains",
-            options=combined_df["Domain"].unique(),
-            default=combined_df["Domain"].unique()
+            options=combined_df["Domain"].cat.categories,
+            default=combined_df["Domain"].cat.categories
         )
     
     with col2:
         selected_occupations = st.multiselect(
             "Select Occupations",
-            options=combined_df["Occupation"].unique(),
+            options=combined_df["Occupation"].cat.categories,
             default=[]
         )
     
     # Apply filters
-    filtered_df = combined_df[combined_df["Domain"].isin(selected_domains)]
+    mask = category_mask(combined_df["Domain"], selected_domains)
     
     if selected_occupations:
-        filtered_df = filtered_df[filtered_df["Occupation"].isin(selected_occupations)]
+        mask &= category_mask(combined_df["Occupation"], selected_occupations)
+    
+    # Export the detail columns too, but not the truncated Task_* display columns
+    filtered_df = get_details_df(combined_df.iloc[mask], details_df).drop(columns=list(TASK_PREVIEW_COLUMNS))
     
     st.write(f"Filtered data contains {len(filtered_df)} tasks")
     
@@ -379,11 +523,12 @@ def render_data_export_tab(combined_df: pd.DataFrame):
     st.subheader("Data Preview")
     st.dataframe(filtered_df.head(10))
     
-    # Download button
-    csv = filtered_df.to_csv(index=False)
+    # Download button (written in 1024-row chunks into one text buffer)
+    csv_buffer = io.StringIO()
+    filtered_df.to_csv(csv_buffer, index=False, chunksize=1024)
     st.download_button(
         label="Download as CSV",
-        data=csv,
+        data=csv_buffer.getvalue(),
         file_name="workbank_filtered_data.csv",
         mime="text/csv"
     )
@@ -409,7 +554,7 @@ def main():
     
     # Load data with caching
     with st.spinner("Loading WORKBank data..."):
-        combined_df, worker_df, expert_df, task_df = load_data()
+        combined_df, details_df, stats, legacy_df, worker_df, expert_df, task_df = load_data()
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
@@ -445,45 +590,31 @@ def main():
     
     # Render selected tab
     if tab_selection == "Overview":
-        render_overview_tab(combined_df)
+        render_overview_tab(stats)
     elif tab_selection == "Automation Desire":
         render_automation_desire_tab(combined_df)
     elif tab_selection == "Automation Viability":
         render_automation_viability_tab(combined_df)
     elif tab_selection == "Task Details":
-        render_task_details_tab(combined_df)
+        render_task_details_tab(combined_df, details_df)
     elif tab_selection == "Data Export":
-        render_data_export_tab(combined_df)
+        render_data_export_tab(combined_df, details_df)
     
     # Legacy visualization (moved to bottom for comparison)
     if st.sidebar.checkbox("Show Legacy Chart"):
         st.markdown("---")
         st.subheader("Legacy Comparison Chart")
         
-        # Create comparison chart similar to original
-        chart_data = combined_df.head(10).copy()
-        chart_data['task_short'] = chart_data['Task'].str[:30] + '...'
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        x_pos = range(len(chart_data))
-        width = 0.35
-        
-        ax.bar([x - width/2 for x in x_pos], chart_data['Automation Desire Rating'], 
-               width, label='Worker Automation Desire', alpha=0.8, color='steelblue')
-        ax.bar([x + width/2 for x in x_pos], chart_data['Expert Capability Rating'], 
-               width, label='Expert AI Capability Rating', alpha=0.8, color='lightcoral')
-        
-        ax.set_xlabel('Tasks')
-        ax.set_ylabel('Rating (1-5 scale)')
-        ax.set_title('Worker Automation Desire vs Expert AI Capability Assessment')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(chart_data['task_short'], rotation=45, ha='right')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Create comparison chart similar to original (drawn client-side by Vega-Lite),
+        # keeping the bars in Task ID order rather than sorted by label
+        st.markdown("**Worker Automation Desire vs Expert AI Capability Assessment**")
+        st.bar_chart(
+            legacy_df,
+            x_label='Tasks',
+            y_label='Rating (1-5 scale)',
+            sort=False,
+            stack=False
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file